@@ -154,9 +154,9 @@ class AlgorithmService:
 
         # First pass: filter contours and optionally mark them for combining
         for cnt in contours:
-            mask = np.zeros((height, width), dtype=np.uint8)
-            cv2.drawContours(mask, [cnt], -1, 255, thickness=-1)
-            contour_area = cv2.countNonZero(mask)
+            # Rasterize only the contour's bounding box rather than a full-size mask
+            mask, x0, y0 = self._rasterize_contour(cnt, height, width)
+            contour_area = cv2.countNonZero(mask) if mask.size else 0
 
             if contour_area >= self.min_area and (self.max_area == 0 or contour_area <= self.max_area):
                 (x, y), radius = cv2.minEnclosingCircle(cnt)
@@ -168,15 +168,15 @@ class AlgorithmService:
                 cv2.circle(temp_mask, center, radius, 255, -1)
 
                 # Also keep track of original pixels
-                original_pixels_mask = cv2.bitwise_or(original_pixels_mask, mask)
+                original_roi = original_pixels_mask[y0:y0 + mask.shape[0], x0:x0 + mask.shape[1]]
+                np.bitwise_or(original_roi, mask, out=original_roi)
 
                 if not self.combine_aois:
                     # Store the contour points for drawing the boundary
                     contour_points = cnt.reshape(-1, 2).tolist()
 
                     # Get the detected pixels for this AOI
-                    detected_pixels = np.argwhere(mask > 0)
-                    detected_pixels_list = detected_pixels[:, [1, 0]].tolist() if len(detected_pixels) > 0 else []
+                    detected_pixels_list = self._nonzero_points(mask, x0, y0)
 
                     # Use actual detected pixel count for area
                     area = len(detected_pixels_list)
@@ -204,8 +204,7 @@ class AlgorithmService:
                 contours = new_contours
 
             for cnt in contours:
-                mask = np.zeros((height, width), dtype=np.uint8)
-                cv2.drawContours(mask, [cnt], -1, 255, thickness=-1)
+                mask, x0, y0 = self._rasterize_contour(cnt, height, width)
                 (x, y), radius = cv2.minEnclosingCircle(cnt)
                 center = (int(x), int(y))
                 radius = int(radius)
@@ -213,9 +212,8 @@ class AlgorithmService:
                 contour_points = cnt.reshape(-1, 2).tolist()
 
                 # Get the original detected pixels that belong to this combined AOI
-                aoi_pixels_mask = cv2.bitwise_and(original_pixels_mask, mask)
-                aoi_pixels = np.argwhere(aoi_pixels_mask > 0)
-                aoi_pixels_list = aoi_pixels[:, [1, 0]].tolist() if len(aoi_pixels) > 0 else []
+                original_roi = original_pixels_mask[y0:y0 + mask.shape[0], x0:x0 + mask.shape[1]]
+                aoi_pixels_list = self._nonzero_points(np.bitwise_and(original_roi, mask), x0, y0)
 
                 # Use actual detected pixel count, not the expanded circle area
                 area = len(aoi_pixels_list)
@@ -233,6 +231,48 @@ class AlgorithmService:
 
         return areas_of_interest, base_contour_count
 
+    @staticmethod
+    def _rasterize_contour(cnt, height, width):
+        """
+        Draw a filled contour into a mask covering only its bounding box, clipped to the image.
+
+        Args:
+            cnt (numpy.ndarray): Contour points.
+            height (int): Image height.
+            width (int): Image width.
+
+        Returns:
+            tuple: (mask, x0, y0) where mask is a uint8 array for the clipped bounding box
+                and (x0, y0) is its top-left corner in image coordinates.
+        """
+        x, y, w, h = cv2.boundingRect(cnt)
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, width), min(y + h, height)
+        mask = np.zeros((max(y1 - y0, 0), max(x1 - x0, 0)), dtype=np.uint8)
+        if mask.size:
+            cv2.drawContours(mask, [cnt], -1, 255, thickness=-1, offset=(-x0, -y0))
+        return mask, x0, y0
+
+    @staticmethod
+    def _nonzero_points(mask, x0, y0):
+        """
+        List the (x, y) image coordinates of the non-zero pixels in a bounding-box mask.
+
+        Args:
+            mask (numpy.ndarray): uint8 mask covering a bounding box.
+            x0 (int): X offset of the bounding box in the image.
+            y0 (int): Y offset of the bounding box in the image.
+
+        Returns:
+            list: [x, y] pairs in row-major order.
+        """
+        if not mask.size:
+            return []
+        points = cv2.findNonZero(mask)
+        if points is None:
+            return []
+        return (points.reshape(-1, 2) + (x0, y0)).tolist()
+
     def apply_hue_expansion(self, img, mask, areas_of_interest, hue_range):
         """
         Expands the pixel detection mask based on hue similarity within AOI circles.
@@ -259,56 +299,54 @@ class AlgorithmService:
 
         # Create expanded mask starting with the original
         expanded_mask = mask.copy()
+        hue_channel = hsv_img[:, :, 0]
+        height, width = hue_channel.shape
 
         for aoi in areas_of_interest:
             detected_pixels = aoi.get('detected_pixels', [])
             if len(detected_pixels) == 0:
                 continue
 
-            # Calculate average hue of detected pixels
-            hue_values = []
-            for px, py in detected_pixels:
-                # Ensure pixel coordinates are within image bounds
-                if 0 <= py < hsv_img.shape[0] and 0 <= px < hsv_img.shape[1]:
-                    hue_values.append(hsv_img[py, px, 0])  # H channel
-
-            if len(hue_values) == 0:
+            # Calculate average hue of detected pixels that fall within the image bounds
+            pixels = np.asarray(detected_pixels, dtype=np.int64).reshape(-1, 2)
+            px, py = pixels[:, 0], pixels[:, 1]
+            in_bounds = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            if not np.any(in_bounds):
                 continue
 
-            avg_hue = int(np.mean(hue_values))
+            avg_hue = int(np.mean(hue_channel[py[in_bounds], px[in_bounds]]))
 
             # Calculate hue range with wraparound handling
             hue_min = avg_hue - hue_range
             hue_max = avg_hue + hue_range
 
-            # Create circular ROI mask for this AOI
-            center = aoi['center']
-            radius = aoi['radius']
-            roi_mask = np.zeros(mask.shape[:2], dtype=np.uint8)
-            cv2.circle(roi_mask, center, radius, 255, -1)
-
-            # Get all pixels within the circular ROI
-            roi_y, roi_x = np.where(roi_mask == 255)
-
-            # Check each pixel in ROI for hue match
-            for py, px in zip(roi_y, roi_x):
-                pixel_hue = hsv_img[py, px, 0]
-
-                # Handle hue wraparound (hue is circular: 0-179 in OpenCV)
-                if hue_min < 0:
-                    # Wraparound at lower bound (e.g., hue=5, range=10 -> -5 to 15)
-                    # Matches if hue >= (180 + hue_min) OR hue <= hue_max
-                    if pixel_hue >= (180 + hue_min) or pixel_hue <= hue_max:
-                        expanded_mask[py, px] = 255
-                elif hue_max >= 180:
-                    # Wraparound at upper bound (e.g., hue=175, range=10 -> 165 to 185)
-                    # Matches if hue >= hue_min OR hue <= (hue_max - 180)
-                    if pixel_hue >= hue_min or pixel_hue <= (hue_max - 180):
-                        expanded_mask[py, px] = 255
-                else:
-                    # No wraparound - simple range check
-                    if hue_min <= pixel_hue <= hue_max:
-                        expanded_mask[py, px] = 255
+            # Get all pixels within the circular ROI, testing squared distances over the
+            # AOI's bounding box instead of rasterizing a full-size circle mask
+            cx, cy = int(aoi['center'][0]), int(aoi['center'][1])
+            radius = int(aoi['radius'])
+            x0, x1 = max(cx - radius, 0), min(cx + radius + 1, width)
+            y0, y1 = max(cy - radius, 0), min(cy + radius + 1, height)
+            if x0 >= x1 or y0 >= y1:
+                continue
+
+            dy, dx = np.ogrid[y0 - cy:y1 - cy, x0 - cx:x1 - cx]
+            roi_y, roi_x = np.nonzero(dx * dx + dy * dy <= radius * radius)
+            roi_y += y0
+            roi_x += x0
+            pixel_hue = hue_channel[roi_y, roi_x].astype(np.int16)
+
+            # Handle hue wraparound (hue is circular: 0-179 in OpenCV)
+            if hue_min < 0:
+                # Wraparound at lower bound (e.g., hue=5, range=10 -> -5 to 15)
+                matches = (pixel_hue >= (180 + hue_min)) | (pixel_hue <= hue_max)
+            elif hue_max >= 180:
+                # Wraparound at upper bound (e.g., hue=175, range=10 -> 165 to 185)
+                matches = (pixel_hue >= hue_min) | (pixel_hue <= (hue_max - 180))
+            else:
+                # No wraparound - simple range check
+                matches = (pixel_hue >= hue_min) & (pixel_hue <= hue_max)
+
+            expanded_mask[roi_y[matches], roi_x[matches]] = 255
 
         return expanded_mask
 
@@ -399,7 +399,7 @@ class MotionDetectionService(QObject):
         _, diff_mask = cv2.threshold(diff, 20, 255, cv2.THRESH_BINARY)
 
         # Calculate percentage of frame that changed
-        changed_pixels = np.count_nonzero(diff_mask)
+        changed_pixels = cv2.countNonZero(diff_mask)
         total_pixels = diff_mask.size
         change_ratio = changed_pixels / total_pixels
 
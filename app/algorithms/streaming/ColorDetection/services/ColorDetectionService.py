@@ -192,6 +192,9 @@ class ColorDetectionService(QObject):
         self._gpu_available = self._check_gpu_availability()
         self._use_gpu = self._gpu_available and self._config.gpu_acceleration
 
+        # Pre-compute morphology kernels for efficiency
+        self._morph_kernel_cache: dict = {}
+
         # HSV conversion cache
         self._target_hsv = None
         self._hsv_ranges = None
@@ -220,6 +223,14 @@ class ColorDetectionService(QObject):
 
         # self.logger.info(f"Color detector initialized (GPU: {self._gpu_available})")
 
+    def _get_morph_kernel(self, size: int) -> np.ndarray:
+        """Get cached morphology kernel."""
+        if size not in self._morph_kernel_cache:
+            self._morph_kernel_cache[size] = cv2.getStructuringElement(
+                cv2.MORPH_ELLIPSE, (size, size)
+            )
+        return self._morph_kernel_cache[size]
+
     def _check_gpu_availability(self) -> bool:
         """Check if GPU acceleration is available."""
         try:
@@ -804,7 +815,7 @@ class ColorDetectionService(QObject):
             # Morphological operations for noise reduction
             if config.morphology_enabled:
                 try:
-                    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+                    kernel = self._get_morph_kernel(3)
                     mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
                     mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
                 except Exception as e:
@@ -870,7 +881,7 @@ class ColorDetectionService(QObject):
 
             # Morphological operations
             if config.morphology_enabled:
-                kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+                kernel = self._get_morph_kernel(3)
                 mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
                 mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
 
@@ -1061,7 +1072,7 @@ class ColorDetectionService(QObject):
 
             # Morphological operations to reduce noise
             morph_size = config.morphology_kernel_size
-            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (morph_size, morph_size))
+            kernel = self._get_morph_kernel(morph_size)
             thresh = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
             thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
 
@@ -1148,7 +1159,7 @@ class ColorDetectionService(QObject):
 
             # Morphological operations
             morph_size = config.morphology_kernel_size
-            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (morph_size, morph_size))
+            kernel = self._get_morph_kernel(morph_size)
             fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel)
             fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_CLOSE, kernel)
 
@@ -1228,7 +1239,7 @@ class ColorDetectionService(QObject):
 
             # Morphological operations
             morph_size = config.morphology_kernel_size
-            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (morph_size, morph_size))
+            kernel = self._get_morph_kernel(morph_size)
             fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel)
             fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_CLOSE, kernel)
 
@@ -1321,7 +1332,7 @@ class ColorDetectionService(QObject):
             # METRIC 2: Pixel Change Ratio (good for detecting large object motion)
             # When objects move locally, significant pixel changes in specific areas
             _, thresh = cv2.threshold(frame_diff, 15, 255, cv2.THRESH_BINARY)  # Lower threshold from 25 to 15
-            changed_pixels = np.count_nonzero(thresh)
+            changed_pixels = cv2.countNonZero(thresh)
             total_pixels = thresh.shape[0] * thresh.shape[1]
             change_ratio = changed_pixels / total_pixels
 
@@ -121,6 +121,9 @@ class MotionDetectionService(QObject):
         self._bg_subtractor_knn = None
         self._init_background_subtractors()
 
+        # Pre-compute morphology kernels for efficiency
+        self._morph_kernel_cache: dict = {}
+
         # Feature detector for camera motion estimation (reduced features for speed)
         self._feature_detector = cv2.ORB_create(nfeatures=100)  # Reduced from 500
         self._matcher = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=False)  # Faster without crossCheck
@@ -140,6 +143,12 @@ class MotionDetectionService(QObject):
         # gpu_status = "GPU-accelerated" if self._use_gpu else "CPU-only"
         # self.logger.info(f"Motion detector initialized with dual-mode support ({gpu_status})")
 
+    def _get_morph_kernel(self, size: int) -> np.ndarray:
+        """Get cached rectangular morphology kernel."""
+        if size not in self._morph_kernel_cache:
+            self._morph_kernel_cache[size] = np.ones((size, size), np.uint8)
+        return self._morph_kernel_cache[size]
+
     def _check_gpu_support(self) -> bool:
         """Check if GPU acceleration is available for OpenCV."""
         try:
@@ -483,7 +492,7 @@ class MotionDetectionService(QObject):
         _, thresh = cv2.threshold(diff, motion_threshold, 255, cv2.THRESH_BINARY)
 
         # Apply morphology to remove noise
-        kernel = np.ones((morphology_size, morphology_size), np.uint8)
+        kernel = self._get_morph_kernel(morphology_size)
         thresh = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
         thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
 
@@ -551,7 +560,7 @@ class MotionDetectionService(QObject):
 
         # Minimal morphology only if needed (CPU only for now)
         if morphology_size > 0:
-            kernel = np.ones((3, 3), np.uint8)  # Fixed small kernel
+            kernel = self._get_morph_kernel(3)  # Fixed small kernel
             fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel, iterations=1)
 
         # Find contours and create detections
@@ -567,7 +576,7 @@ class MotionDetectionService(QObject):
 
         # Minimal morphology only if needed
         if morphology_size > 0:
-            kernel = np.ones((3, 3), np.uint8)  # Fixed small kernel
+            kernel = self._get_morph_kernel(3)  # Fixed small kernel
             fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel, iterations=1)
 
         # Find contours and create detections
@@ -605,7 +614,7 @@ class MotionDetectionService(QObject):
         binary_mask = (motion_mask * 255).astype(np.uint8)
 
         # Apply morphology
-        kernel = np.ones((morphology_size * 2, morphology_size * 2), np.uint8)
+        kernel = self._get_morph_kernel(morphology_size * 2)
         binary_mask = cv2.morphologyEx(binary_mask, cv2.MORPH_OPEN, kernel)
         binary_mask = cv2.morphologyEx(binary_mask, cv2.MORPH_CLOSE, kernel)
 
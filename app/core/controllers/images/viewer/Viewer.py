@@ -254,6 +254,10 @@ class Viewer(QMainWindow, Ui_Viewer):
 
     def closeEvent(self, event):
         """Event triggered on window close; quits all thumbnail threads."""
+        # Write any flag changes still waiting on the debounce timer
+        if hasattr(self, 'aoi_controller'):
+            self.aoi_controller.flush_xml()
+
         for thread, loader in self._threads:
             if thread.isRunning():
                 thread.requestInterruption()  # Optional: politely request interruption
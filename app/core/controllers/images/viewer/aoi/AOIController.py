@@ -17,7 +17,7 @@ from PySide6.QtWidgets import (
     QMenu, QApplication, QAbstractItemView, QColorDialog, QMessageBox
 )
 from shiboken6 import isValid as _qt_is_valid
-from PySide6.QtCore import Qt, QSize, QPoint
+from PySide6.QtCore import Qt, QSize, QPoint, QTimer
 from PySide6.QtGui import QCursor, QColor
 
 from core.services.LoggerService import LoggerService
@@ -48,6 +48,7 @@ class AOIController:
 
         # AOI state
         self.selected_aoi_index = -1
+        self.selected_visible_index = -1  # Visible container currently styled as selected
         self.flagged_aois = {}
         self.filter_flagged_only = False
 
@@ -70,6 +71,13 @@ class AOIController:
         self._cached_aoi_service = None
         self._cached_image_index = None
 
+        # Flag toggles only mark the XML dirty; rapid toggles coalesce into a single write
+        self._xml_dirty = False
+        self._xml_flush_timer = QTimer()
+        self._xml_flush_timer.setSingleShot(True)
+        self._xml_flush_timer.setInterval(500)
+        self._xml_flush_timer.timeout.connect(self.flush_xml)
+
         # Create UI component internally
         self.ui_component = AOIUIComponent(self)
 
@@ -94,7 +102,12 @@ class AOIController:
             # Create new service for current image
             if current_image_idx < len(self.parent.images):
                 image = self.parent.images[current_image_idx]
-                self._cached_aoi_service = AOIService(image)
+                # Reuse the viewer's decoded image instead of reading it from disk again
+                img_array = None
+                image_service = getattr(self.parent, 'current_image_service', None)
+                if image_service is not None and getattr(image_service, 'path', None) == image.get('path'):
+                    img_array = image_service.img_array
+                self._cached_aoi_service = AOIService(image, img_array=img_array)
                 self._cached_image_index = current_image_idx
                 return self._cached_aoi_service
 
@@ -125,7 +138,8 @@ class AOIController:
                                 self.flagged_aois[img_idx] = set()
                             self.flagged_aois[img_idx].add(aoi_idx)
 
-    def calculate_aoi_average_info(self, area_of_interest, is_thermal, temperature_data, temperature_unit):
+    def calculate_aoi_average_info(self, area_of_interest, is_thermal, temperature_data, temperature_unit,
+                                   img_array=None):
         """Calculate average color or temperature for an AOI.
 
         Args:
@@ -133,6 +147,8 @@ class AOIController:
             is_thermal (bool): Whether this is a thermal image
             temperature_data: Temperature data array for thermal images
             temperature_unit (str): Temperature unit ('F' or 'C')
+            img_array (np.ndarray, optional): RGB array of the current image. When provided the
+                color is computed from it directly instead of through the cached AOIService.
 
         Returns:
             tuple: (info_text, rgb_tuple) where info_text is the formatted string and
@@ -157,41 +173,30 @@ class AOIController:
 
                 center = area_of_interest['center']
                 radius = area_of_interest.get('radius', 0)
-                cx, cy = center
-                shape = temperature_data.shape
-
-                # Get temperature values for detected pixels or within the AOI circle
-                temps = []
-
-                # If we have detected pixels, use those for temperature
-                if 'detected_pixels' in area_of_interest and area_of_interest['detected_pixels']:
-                    for pixel in area_of_interest['detected_pixels']:
-                        if isinstance(pixel, (list, tuple)) and len(pixel) >= 2:
-                            px, py = int(pixel[0]), int(pixel[1])
-                            if 0 <= py < shape[0] and 0 <= px < shape[1]:
-                                temps.append(temperature_data[py][px])
-                # Otherwise sample temperatures within the circle
+
+                # Average detected pixels if we have them, otherwise sample within the circle
+                detected_pixels = area_of_interest.get('detected_pixels')
+                if detected_pixels is not None and len(detected_pixels) > 0:
+                    avg_temp = AOIService.points_mean(temperature_data, detected_pixels)
                 else:
-                    for y in range(max(0, cy - radius), min(shape[0], cy + radius + 1)):
-                        for x in range(max(0, cx - radius), min(shape[1], cx + radius + 1)):
-                            # Check if pixel is within circle
-                            if (x - cx) ** 2 + (y - cy) ** 2 <= radius ** 2:
-                                temps.append(temperature_data[y][x])
-
-                if temps:
-                    avg_temp = sum(temps) / len(temps)
+                    avg_temp = AOIService.circle_mean(temperature_data, center, radius)
+
+                if avg_temp is not None:
                     return f"Avg Temp: {avg_temp:.1f}° {temperature_unit}", None
                 else:
                     return None, None
 
             # For non-thermal images, calculate average color
             else:
-                # Use cached AOIService for current image
-                aoi_service = self._get_aoi_service()
-                if not aoi_service:
-                    return None, None
+                if img_array is not None:
+                    color_result = AOIService.compute_representative_color(img_array, area_of_interest)
+                else:
+                    # Use cached AOIService for current image
+                    aoi_service = self._get_aoi_service()
+                    if not aoi_service:
+                        return None, None
 
-                color_result = aoi_service.get_aoi_representative_color(area_of_interest)
+                    color_result = aoi_service.get_aoi_representative_color(area_of_interest)
                 if color_result:
                     # Return hue angle, hex color, and RGB tuple for the color square
                     hex_color = color_result['hex']
@@ -237,16 +242,21 @@ class AOIController:
 
         # Delegate UI updates to UI component
         if self.ui_component:
-            # Clear ALL container styles first
-            for i, container in enumerate(self.ui_component.get_aoi_containers()):
-                self.ui_component.update_aoi_selection_style(container, False)
+            containers = self.ui_component.get_aoi_containers()
+
+            # Only the previously selected container needs its style cleared
+            is_selecting = aoi_index >= 0 and 0 <= visible_index < len(containers)
+            prev_index = self.selected_visible_index
+            if 0 <= prev_index < len(containers) and not (is_selecting and prev_index == visible_index):
+                self.ui_component.update_aoi_selection_style(containers[prev_index], False)
+            self.selected_visible_index = -1
 
             # Apply selection style to the clicked container
-            if aoi_index >= 0 and visible_index >= 0 and visible_index < len(self.ui_component.get_aoi_containers()):
-                container = self.ui_component.get_aoi_containers()[visible_index]
+            if is_selecting:
+                container = containers[visible_index]
                 self.ui_component.update_aoi_selection_style(container, True)
                 container.update()
-                container.repaint()
+                self.selected_visible_index = visible_index
 
                 # Scroll the AOI list to bring the selected item into view
                 self.ui_component.scroll_to_aoi(visible_index)
@@ -325,20 +335,27 @@ class AOIController:
                 aoi = image['areas_of_interest'][aoi_index]
                 aoi['flagged'] = is_flagged
 
-                # Update the XML element if it exists
+                # Update the XML element if it exists and schedule a (debounced) save
                 if 'xml' in aoi and aoi['xml'] is not None:
                     aoi['xml'].set('flagged', str(is_flagged))
-                    # Save the XML file using the xml_service method
-                    if hasattr(self.parent, 'xml_service') and self.parent.xml_service:
-                        try:
-                            # Use the xml_service save method
-                            self.parent.xml_service.save_xml_file(self.parent.xml_path)
-                        except Exception:
-                            pass
-                    else:
-                        pass
-                else:
-                    pass
+                    self._xml_dirty = True
+                    self._xml_flush_timer.start()
+
+    def flush_xml(self):
+        """Write pending flag changes to the XML file, if any.
+
+        Called by the debounce timer, and by the viewer before switching images or closing.
+        """
+        self._xml_flush_timer.stop()
+        if not self._xml_dirty:
+            return
+        self._xml_dirty = False
+
+        if hasattr(self.parent, 'xml_service') and self.parent.xml_service:
+            try:
+                self.parent.xml_service.save_xml_file(self.parent.xml_path)
+            except Exception as e:
+                self.logger.error(f"Failed to save XML: {e}")
 
     def save_aoi_comment_to_xml(self, image_index, aoi_index, comment):
         """Save a user comment for an AOI to XML.
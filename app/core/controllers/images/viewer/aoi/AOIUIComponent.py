@@ -16,8 +16,8 @@ from PySide6.QtWidgets import (
     QMenu, QApplication, QAbstractItemView, QFrame, QProgressBar
 )
 from shiboken6 import isValid as _qt_is_valid
-from PySide6.QtCore import Qt, QSize, QPoint, QTimer
-from PySide6.QtGui import QCursor
+from PySide6.QtCore import Qt, QSize, QPoint, QTimer, QRect
+from PySide6.QtGui import QCursor, QPixmap, QPainter, QFont, QColor, QGuiApplication
 
 from core.services.LoggerService import LoggerService
 from core.views.images.viewer.widgets.QtImageViewer import QtImageViewer
@@ -30,6 +30,24 @@ class AOIUIComponent:
     This component handles all UI operations while AOIController manages business logic.
     """
 
+    # Stylesheets are built once and reused for every container
+    _UNSELECTED_CONTAINER_STYLE = (
+        "#AOIItemContainer { border: 1px solid #666; border-radius: 5px; background-color: transparent; }"
+    )
+    _SELECTED_CONTAINER_STYLE_TEMPLATE = (
+        "#AOIItemContainer {{ border: 1px solid #666; border-radius: 5px; background-color: rgba({r}, {g}, {b}, 40); }}"
+    )
+    _INFO_BAR_STYLE = "QWidget { background-color: rgba(0, 0, 0, 150); border-radius: 2px; }"
+    _INFO_LABEL_STYLE = "QLabel { color: white; font-size: 10px; }"
+    _SEPARATOR_STYLE = "QLabel { color: #666; font-size: 10px; }"
+    _CONFIDENCE_STYLE_TEMPLATE = "QLabel {{ color: {color}; font-size: 10px; font-weight: bold; }}"
+    _COLOR_SQUARE_STYLE_TEMPLATE = "QLabel {{ background-color: rgb({r}, {g}, {b}); border: 1px solid white; }}"
+
+    # Thumbnail strip limits: stay well inside QImage/QPixmap size limits, and keep
+    # unusually wide crops out of the strip so they don't pad every other row
+    _MAX_STRIP_HEIGHT = 16384
+    _MAX_STRIP_WIDTH_FACTOR = 2
+
     def __init__(self, aoi_controller):
         """
         Initialize the AOI UI component.
@@ -50,6 +68,64 @@ class AOIUIComponent:
         self.batch_loading_state = None  # Stores state during batch loading
         self.batch_progress_widget = None  # Progress indicator widget
 
+        # Formatted selection stylesheets keyed by identifier color
+        self._selected_container_styles = {}
+
+        # Rasterize the action icons once (at the display's pixel ratio so they stay
+        # sharp on HiDPI screens) and share them across every AOI container
+        dpr = self._device_pixel_ratio()
+        icon_size = QSize(16, 16)
+        self.flag_icon_active = qta.icon('fa6s.flag', color='#FF7043').pixmap(icon_size, dpr)
+        self.flag_icon_inactive = qta.icon('fa6s.flag', color='#808080').pixmap(icon_size, dpr)
+        self.location_icon = qta.icon('fa6s.location-dot', color='#4CAF50').pixmap(icon_size, dpr)
+        self.delete_icon = qta.icon('fa6s.trash', color='#FF5252').pixmap(icon_size, dpr)
+        self.comment_icon_active = self._render_emoji_pixmap("📝", '#FFD700', bold=True, dpr=dpr)
+        self.comment_icon_inactive = self._render_emoji_pixmap("📝", '#808080', dpr=dpr)
+
+    def _device_pixel_ratio(self):
+        """Return the device pixel ratio of the viewer window, or of the primary screen.
+
+        Returns:
+            float: Device pixel ratio (1.0 if it cannot be determined)
+        """
+        try:
+            dpr = float(self.aoi_controller.parent.devicePixelRatioF())
+        except Exception:
+            screen = QGuiApplication.primaryScreen()
+            dpr = float(screen.devicePixelRatio()) if screen is not None else 1.0
+        return dpr if dpr > 0 else 1.0
+
+    @staticmethod
+    def _render_emoji_pixmap(text, color, size=16, bold=False, dpr=1.0):
+        """Render an emoji glyph to a pixmap so it is shaped only once.
+
+        Args:
+            text (str): The emoji to render
+            color (str): Pen color used for non-color emoji fonts
+            size (int): Width and height of the pixmap in logical pixels
+            bold (bool): Whether to render with a bold font
+            dpr (float): Device pixel ratio to render at
+
+        Returns:
+            QPixmap: Transparent pixmap containing the rendered glyph
+        """
+        device_size = max(1, round(size * dpr))
+        pixmap = QPixmap(device_size, device_size)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        try:
+            font = QFont()
+            font.setPixelSize(size - 2)
+            font.setBold(bold)
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+            # The painter works in logical pixels once the pixel ratio is set
+            painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, text)
+        finally:
+            painter.end()
+        return pixmap
+
     def load_areas_of_interest(self, augmented_image, areas_of_interest):
         """Load areas of interest thumbnails for a given image.
 
@@ -82,6 +158,7 @@ class AOIUIComponent:
         aoi_list_widget.clear()
         self.highlights = []
         self.aoi_containers = []  # Reset container list
+        self.aoi_controller.selected_visible_index = -1
 
         # Get flagged AOIs for this image
         img_idx = self.aoi_controller.parent.current_image
@@ -108,19 +185,118 @@ class AOIUIComponent:
         # Re-enable signals after rebuild
         aoi_list_widget.blockSignals(False)
 
+        # Resolve per-image viewer state once instead of once per AOI
+        render_context = self._build_render_context(aoi_list_widget)
+
         # If we have many AOIs, use batch loading to keep UI responsive
         if filtered_count > 100:
-            self._start_batch_loading(aois_with_indices, augmented_image, flagged_set)
+            self._start_batch_loading(aois_with_indices, augmented_image, flagged_set, render_context)
         else:
             # For small counts, load synchronously (fast enough)
+            thumbnails = self._build_thumbnail_strip(aois_with_indices, augmented_image, render_context)
             visible_container_index = 0
-            for original_index, area_of_interest in aois_with_indices:
-                container = self._create_aoi_container(original_index, visible_container_index, area_of_interest, augmented_image, flagged_set)
+            for (original_index, area_of_interest), thumbnail in zip(aois_with_indices, thumbnails):
+                container = self._create_aoi_container(
+                    original_index, visible_container_index, area_of_interest,
+                    augmented_image, flagged_set, render_context, thumbnail
+                )
                 if container:
                     self.aoi_containers.append(container)
                     visible_container_index += 1
 
-    def _create_aoi_container(self, original_index, visible_container_index, area_of_interest, augmented_image, flagged_set):
+    def _build_render_context(self, aoi_list_widget):
+        """Capture the viewer state shared by every AOI container of the current image.
+
+        Args:
+            aoi_list_widget: The AOI list widget containers are added to
+
+        Returns:
+            dict: Image array, thermal settings, crop function and list widget
+        """
+        parent = self.aoi_controller.parent
+        thermal_controller = getattr(parent, 'thermal_controller', None)
+        return {
+            'aoi_list_widget': aoi_list_widget,
+            'img_array': getattr(parent, 'current_image_array', None),
+            'is_thermal': parent.is_thermal,
+            'temperature_data': thermal_controller.temperature_data if thermal_controller is not None else None,
+            'temperature_unit': parent.temperature_unit,
+            'crop_image': parent.crop_image,
+        }
+
+    @staticmethod
+    def _crop_aoi(augmented_image, area_of_interest, render_context):
+        """Crop the thumbnail region (AOI circle plus a 10px margin) from the image."""
+        center = area_of_interest['center']
+        radius = area_of_interest['radius'] + 10
+        return render_context['crop_image'](
+            augmented_image, center[0] - radius, center[1] - radius, center[0] + radius, center[1] + radius
+        )
+
+    def _build_thumbnail_strip(self, aois_with_indices, augmented_image, render_context):
+        """Convert the thumbnails of several AOIs to pixmaps with a single QImage conversion.
+
+        The crops are stacked vertically into one array, converted once, and each thumbnail
+        is then cut back out of the strip pixmap. Crops much wider than the median, or that
+        would push the strip past _MAX_STRIP_HEIGHT, are left as None so the caller converts
+        them individually.
+
+        Args:
+            aois_with_indices: List of (original_index, aoi_data) tuples
+            augmented_image: Image array for thumbnails
+            render_context: Per-image state from _build_render_context
+
+        Returns:
+            list: QPixmap per AOI, or None where no thumbnail could be produced
+        """
+        thumbnails = [None] * len(aois_with_indices)
+        if augmented_image is None:
+            return thumbnails
+
+        try:
+            crops = [self._crop_aoi(augmented_image, aoi, render_context) for _, aoi in aois_with_indices]
+            widths = [crop.shape[1] for crop in crops if crop.size]
+            if not widths:
+                return thumbnails
+            max_width = int(np.median(widths)) * self._MAX_STRIP_WIDTH_FACTOR
+
+            # Pick the crops that go into the strip and their row offsets
+            placements = []
+            strip_height = 0
+            strip_width = 0
+            for i, crop in enumerate(crops):
+                if not crop.size or crop.shape[1] > max_width:
+                    continue
+                if strip_height + crop.shape[0] > self._MAX_STRIP_HEIGHT:
+                    continue
+                placements.append((i, strip_height))
+                strip_height += crop.shape[0]
+                strip_width = max(strip_width, crop.shape[1])
+            if not placements:
+                return thumbnails
+
+            strip = np.zeros((strip_height, strip_width) + augmented_image.shape[2:], dtype=augmented_image.dtype)
+            for i, offset in placements:
+                crop = crops[i]
+                strip[offset:offset + crop.shape[0], :crop.shape[1]] = crop
+
+            strip_pixmap = QPixmap.fromImage(qimage2ndarray.array2qimage(strip))
+            if strip_pixmap.isNull():
+                # Conversion failed silently; let every AOI convert on its own
+                return [None] * len(aois_with_indices)
+
+            for i, offset in placements:
+                crop = crops[i]
+                thumbnails[i] = strip_pixmap.copy(QRect(0, offset, crop.shape[1], crop.shape[0]))
+        except Exception as e:
+            # Fall back to converting each thumbnail on its own
+            self.logger.error(f"Error building AOI thumbnail strip: {e}")
+            return [None] * len(aois_with_indices)
+
+        return thumbnails
+
+    def _create_aoi_container(self, original_index, visible_container_index, area_of_interest, augmented_image,
+                              flagged_set, render_context, thumbnail=None):
         """Create a single AOI container widget.
 
         Args:
@@ -129,13 +305,14 @@ class AOIUIComponent:
             area_of_interest: AOI dictionary
             augmented_image: Image array for thumbnails
             flagged_set: Set of flagged AOI indices
+            render_context: Per-image state from _build_render_context
+            thumbnail: Optional pre-converted QPixmap from _build_thumbnail_strip
 
         Returns:
             QWidget: The created container widget or None if creation failed
         """
         try:
-            # Get UI elements from parent
-            aoi_list_widget = self.aoi_controller.parent.aoiListWidget
+            aoi_list_widget = render_context['aoi_list_widget']
             if not aoi_list_widget:
                 return None
             # Create container widget for thumbnail and label
@@ -147,9 +324,7 @@ class AOIUIComponent:
             layout.setSpacing(4)
             layout.setContentsMargins(6, 6, 6, 6)
             # Base border around each list item container
-            container.setStyleSheet(
-                "#AOIItemContainer { border: 1px solid #666; border-radius: 4px; background-color: transparent; }"
-            )
+            container.setStyleSheet(self._UNSELECTED_CONTAINER_STYLE)
 
             # Set up click handling for selection (use original index for selection)
             def handle_click(event, idx=original_index, vis_idx=visible_container_index):
@@ -162,8 +337,6 @@ class AOIUIComponent:
                 return container
 
             center = area_of_interest['center']
-            radius = area_of_interest['radius'] + 10
-            crop_arr = self.aoi_controller.parent.crop_image(augmented_image, center[0] - radius, center[1] - radius, center[0] + radius, center[1] + radius)
 
             # Create the image viewer
 
@@ -178,7 +351,10 @@ class AOIUIComponent:
                 pass
             # Safely set the image on the highlight viewer
             try:
-                img = qimage2ndarray.array2qimage(crop_arr)
+                if thumbnail is not None:
+                    img = thumbnail
+                else:
+                    img = qimage2ndarray.array2qimage(self._crop_aoi(augmented_image, area_of_interest, render_context))
                 if _qt_is_valid(highlight):
                     highlight.setImage(img)
                 else:
@@ -190,16 +366,12 @@ class AOIUIComponent:
             highlight.canPan = False
 
             # Calculate average color/temperature for the AOI (business logic)
-            # Get temperature data from thermal controller if available
-            temperature_data = None
-            if hasattr(self.aoi_controller.parent, 'thermal_controller'):
-                temperature_data = self.aoi_controller.parent.thermal_controller.temperature_data
-
             avg_color_info, color_rgb = self.aoi_controller.calculate_aoi_average_info(
                 area_of_interest,
-                self.aoi_controller.parent.is_thermal,
-                temperature_data,
-                self.aoi_controller.parent.temperature_unit
+                render_context['is_thermal'],
+                render_context['temperature_data'],
+                render_context['temperature_unit'],
+                img_array=render_context['img_array']
             )
 
             # Create coordinate label with pixel area
@@ -238,12 +410,7 @@ class AOIUIComponent:
     def _create_top_info_widget(self, coord_text, original_index, area_of_interest):
         """Create the top info bar showing coordinates and area."""
         info_widget = QWidget()
-        info_widget.setStyleSheet("""
-            QWidget {
-                background-color: rgba(0, 0, 0, 150);
-                border-radius: 2px;
-            }
-        """)
+        info_widget.setStyleSheet(self._INFO_BAR_STYLE)
 
         # Build tooltip with confidence info if available
         tooltip_text = "AOI Information\nRight-click to copy data to clipboard"
@@ -260,12 +427,7 @@ class AOIUIComponent:
 
         coord_label = QLabel(coord_text)
         coord_label.setAlignment(Qt.AlignCenter)
-        coord_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 10px;
-            }
-        """)
+        coord_label.setStyleSheet(self._INFO_LABEL_STYLE)
         info_layout.addWidget(coord_label)
 
         # Add confidence display if available
@@ -274,7 +436,7 @@ class AOIUIComponent:
 
             # Add a separator
             separator = QLabel("|")
-            separator.setStyleSheet("QLabel { color: #666; font-size: 10px; }")
+            separator.setStyleSheet(self._SEPARATOR_STYLE)
             info_layout.addWidget(separator)
 
             # Confidence icon with color based on value
@@ -293,13 +455,7 @@ class AOIUIComponent:
 
             # Confidence label
             conf_label = QLabel(f"{conf_icon} {confidence:.1f}%")
-            conf_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {conf_color};
-                    font-size: 10px;
-                    font-weight: bold;
-                }}
-            """)
+            conf_label.setStyleSheet(self._CONFIDENCE_STYLE_TEMPLATE.format(color=conf_color))
             conf_label.setToolTip(f"Confidence Score: {confidence:.1f}%")
             info_layout.addWidget(conf_label)
 
@@ -318,12 +474,7 @@ class AOIUIComponent:
     def _create_bottom_info_widget(self, avg_color_info, color_rgb, original_index, flagged_set, area_of_interest):
         """Create the bottom info bar showing color/temperature info and actions."""
         info_widget = QWidget()
-        info_widget.setStyleSheet("""
-            QWidget {
-                background-color: rgba(0, 0, 0, 150);
-                border-radius: 2px;
-            }
-        """)
+        info_widget.setStyleSheet(self._INFO_BAR_STYLE)
         info_widget.setToolTip("AOI Information\nRight-click to copy data to clipboard")
         info_layout = QHBoxLayout(info_widget)
         info_layout.setContentsMargins(4, 2, 4, 2)
@@ -333,24 +484,16 @@ class AOIUIComponent:
         if color_rgb is not None:
             color_square = QLabel()
             color_square.setFixedSize(12, 12)
-            color_square.setStyleSheet(f"""
-                QLabel {{
-                    background-color: rgb({color_rgb[0]}, {color_rgb[1]}, {color_rgb[2]});
-                    border: 1px solid white;
-                }}
-            """)
+            color_square.setStyleSheet(
+                self._COLOR_SQUARE_STYLE_TEMPLATE.format(r=color_rgb[0], g=color_rgb[1], b=color_rgb[2])
+            )
             info_layout.addWidget(color_square)
 
         # Optional info text
         if avg_color_info:
             color_label = QLabel(avg_color_info)
             color_label.setAlignment(Qt.AlignCenter)
-            color_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 10px;
-                }
-            """)
+            color_label.setStyleSheet(self._INFO_LABEL_STYLE)
             info_layout.addWidget(color_label)
 
         # Stretch between info and action icons
@@ -358,12 +501,11 @@ class AOIUIComponent:
 
         # Flag icon (always visible)
         is_flagged = original_index in flagged_set
-        flag_color = '#FF7043' if is_flagged else '#808080'
-        flag_icon = qta.icon('fa6s.flag', color=flag_color)
         flag_label = QLabel()
+        flag_label.setFixedSize(16, 16)
         flag_label.setCursor(Qt.PointingHandCursor)
         flag_label.setToolTip("Unflag AOI" if is_flagged else "Flag AOI")
-        flag_label.setPixmap(flag_icon.pixmap(16, 16))
+        flag_label.setPixmap(self.flag_icon_active if is_flagged else self.flag_icon_inactive)
 
         def make_flag_click_handler(aoi_idx):
             return lambda event: self.aoi_controller.toggle_aoi_flag_by_index(aoi_idx)
@@ -373,13 +515,14 @@ class AOIUIComponent:
 
         # Comment icon (always visible)
         user_comment = area_of_interest.get('user_comment', '')
-        comment_icon = QLabel("📝")
+        comment_icon = QLabel()
+        comment_icon.setFixedSize(16, 16)
         comment_icon.setCursor(Qt.PointingHandCursor)
         if user_comment:
-            comment_icon.setStyleSheet("QLabel { color: #FFD700; font-size: 14px; font-weight: bold; }")
+            comment_icon.setPixmap(self.comment_icon_active)
             comment_icon.setToolTip(f"Comment:\n{user_comment}\n\nClick to edit comment")
         else:
-            comment_icon.setStyleSheet("QLabel { color: #808080; font-size: 14px; }")
+            comment_icon.setPixmap(self.comment_icon_inactive)
             comment_icon.setToolTip(
                 "No comment yet.\nClick to add a comment for this AOI.\n\n"
                 "Use comments to note important details, observations,\n"
@@ -393,11 +536,10 @@ class AOIUIComponent:
         info_layout.addWidget(comment_icon)
 
         # Location icon (always visible)
-        location_icon = qta.icon('fa6s.location-dot', color='#4CAF50')
         location_label = QLabel()
         location_label.setCursor(Qt.PointingHandCursor)
         location_label.setToolTip("Calculate and show GPS location for this AOI")
-        location_label.setPixmap(location_icon.pixmap(16, 16))
+        location_label.setPixmap(self.location_icon)
 
         def make_location_click_handler(aoi_idx, widget=location_label):
             return lambda event: self.aoi_controller.show_aoi_location(aoi_idx, anchor_widget=widget)
@@ -410,11 +552,10 @@ class AOIUIComponent:
         is_user_created = area_of_interest.get('user_created', False) or 'detected_pixels' not in area_of_interest
 
         if is_user_created:
-            delete_icon = qta.icon('fa6s.trash', color='#FF5252')
             delete_label = QLabel()
             delete_label.setCursor(Qt.PointingHandCursor)
             delete_label.setToolTip("Delete this AOI")
-            delete_label.setPixmap(delete_icon.pixmap(16, 16))
+            delete_label.setPixmap(self.delete_icon)
 
             def make_delete_click_handler(aoi_idx):
                 return lambda event: self.aoi_controller.delete_aoi(aoi_idx)
@@ -465,16 +606,15 @@ class AOIUIComponent:
         """
         if selected:
             # Get the current settings color for the selection (typically magenta/pink)
-            color = self.aoi_controller.parent.settings.get('identifier_color', [255, 255, 0])
-            container.setStyleSheet(
-                f"#AOIItemContainer {{ border: 1px solid #666; border-radius: 5px; background-color: rgba({color[0]}, {color[1]}, {color[2]}, 40); }}"
-            )
+            color = tuple(self.aoi_controller.parent.settings.get('identifier_color', [255, 255, 0])[:3])
+            style = self._selected_container_styles.get(color)
+            if style is None:
+                style = self._SELECTED_CONTAINER_STYLE_TEMPLATE.format(r=color[0], g=color[1], b=color[2])
+                self._selected_container_styles[color] = style
+            container.setStyleSheet(style)
         else:
             # Transparent background but keep the border
-            container.setStyleSheet(
-                "#AOIItemContainer { border: 1px solid #666; border-radius: 5px; background-color: transparent; }"
-            )
-            container.repaint()
+            container.setStyleSheet(self._UNSELECTED_CONTAINER_STYLE)
 
     def scroll_to_aoi(self, visible_index):
         """Scroll the AOI list to bring the selected item into view.
@@ -514,8 +654,9 @@ class AOIUIComponent:
             aoi_list_widget.clear()
         self.aoi_containers = []
         self.highlights = []
+        self.aoi_controller.selected_visible_index = -1
 
-    def _start_batch_loading(self, aois_with_indices, augmented_image, flagged_set):
+    def _start_batch_loading(self, aois_with_indices, augmented_image, flagged_set, render_context):
         """
         Start batch loading of AOI containers.
 
@@ -523,12 +664,14 @@ class AOIUIComponent:
             aois_with_indices: List of (original_index, aoi_data) tuples
             augmented_image: Image array for thumbnails
             flagged_set: Set of flagged AOI indices
+            render_context: Per-image state from _build_render_context
         """
         # Initialize batch loading state
         self.batch_loading_state = {
             'aois_with_indices': aois_with_indices,
             'augmented_image': augmented_image,
             'flagged_set': flagged_set,
+            'render_context': render_context,
             'current_index': 0,
             'visible_container_index': 0,
             'total_count': len(aois_with_indices),
@@ -552,15 +695,18 @@ class AOIUIComponent:
         start_idx = state['current_index']
         end_idx = min(start_idx + state['batch_size'], state['total_count'])
 
-        # Process batch
-        for i in range(start_idx, end_idx):
-            original_index, area_of_interest = state['aois_with_indices'][i]
+        # Process batch, converting all of its thumbnails in one go
+        batch = state['aois_with_indices'][start_idx:end_idx]
+        thumbnails = self._build_thumbnail_strip(batch, state['augmented_image'], state['render_context'])
+        for (original_index, area_of_interest), thumbnail in zip(batch, thumbnails):
             container = self._create_aoi_container(
                 original_index,
                 state['visible_container_index'],
                 area_of_interest,
                 state['augmented_image'],
-                state['flagged_set']
+                state['flagged_set'],
+                state['render_context'],
+                thumbnail
             )
             if container:
                 self.aoi_containers.append(container)
@@ -5,6 +5,7 @@ This controller manages the export of image files to ZIP format for
 easy distribution and archiving.
 """
 
+import errno
 import os
 import shutil
 import tempfile
@@ -26,6 +27,15 @@ from core.views.images.viewer.dialogs.ZipExportDialog import ZipExportDialog
 from core.views.images.viewer.dialogs.ExportProgressDialog import ExportProgressDialog
 
 
+# Errors meaning a hard link cannot be created here, so staging falls back to copying
+_LINK_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EPERM, errno.EACCES, errno.EMLINK,
+    getattr(errno, 'ENOTSUP', errno.EPERM), getattr(errno, 'EOPNOTSUPP', errno.EPERM),
+}
+# ERROR_INVALID_FUNCTION (e.g. FAT volumes) and ERROR_NOT_SAME_DEVICE on Windows
+_LINK_UNSUPPORTED_WINERRORS = {1, 17}
+
+
 class ZipExportThread(QThread):
     success = Signal()
     errorOccurred = Signal(str)
@@ -236,6 +246,32 @@ class ZipExportController:
         }
         os.makedirs(self._native_ctx['results_root'], exist_ok=True)
 
+    @staticmethod
+    def _stage_file(src_path, dst_path):
+        """
+        Place a source file in the staging folder without copying its bytes when possible.
+
+        Staged files are only read while zipping and the staging folder is removed
+        afterwards, so a hard link is sufficient. Falls back to a full copy when
+        linking is not possible (e.g. staging on a different volume).
+
+        Any existing destination is unlinked first: it may be a hard link to another
+        source file (two images mapping to the same staging path), and copying over
+        it would overwrite that original.
+
+        Args:
+            src_path (str): File to stage.
+            dst_path (str): Destination path inside the staging folder.
+        """
+        if os.path.lexists(dst_path):
+            os.unlink(dst_path)
+        try:
+            os.link(src_path, dst_path)
+        except OSError as e:
+            if e.errno not in _LINK_UNSUPPORTED_ERRNOS and getattr(e, 'winerror', None) not in _LINK_UNSUPPORTED_WINERRORS:
+                raise
+            shutil.copy2(src_path, dst_path)
+
     def _export_native_copy_one(self, img, staging_root):
         ctx = getattr(self, '_native_ctx', {})
         images_root = ctx.get('images_root')
@@ -251,7 +287,7 @@ class ZipExportController:
             rel_path = os.path.basename(src_path)
         dst_path = os.path.join(images_root, rel_path)
         os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-        shutil.copy2(src_path, dst_path)
+        self._stage_file(src_path, dst_path)
 
     def _export_native_finalize(self, staging_root):
         ctx = getattr(self, '_native_ctx', {})
@@ -295,7 +331,7 @@ class ZipExportController:
                             dst_mask = os.path.join(results_root, mask_name)
                             os.makedirs(os.path.dirname(dst_mask), exist_ok=True)
                             try:
-                                shutil.copy2(src_mask, dst_mask)
+                                self._stage_file(src_mask, dst_mask)
                             except Exception:
                                 pass
 
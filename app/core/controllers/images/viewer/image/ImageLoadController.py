@@ -53,6 +53,9 @@ class ImageLoadController:
                 if hasattr(self.parent, 'ui_style_controller'):
                     self.parent.ui_style_controller.update_magnify_button_style()
 
+            # Write any pending flag changes before moving on
+            self.parent.aoi_controller.flush_xml()
+
             image = self.parent.images[self.parent.current_image]
 
             # Always sync the active thumbnail/index
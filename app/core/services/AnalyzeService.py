@@ -400,21 +400,10 @@ class AnalyzeService(QObject):
             thumb_filename = f"{path_hash}.jpg"
             thumb_path = thumb_dir / thumb_filename
 
-            # Convert to RGB if needed
-            if len(img.shape) == 2:
-                # Grayscale
-                img_rgb = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
-            elif img.shape[2] == 4:
-                # RGBA to RGB
-                img_rgb = cv2.cvtColor(img, cv2.COLOR_BGRA2RGB)
-            else:
-                # BGR to RGB
-                img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-
             # Calculate thumbnail dimensions maintaining aspect ratio (max 100x56)
             # This matches PIL's thumbnail() behavior
             max_width, max_height = 100, 56
-            height, width = img_rgb.shape[:2]
+            height, width = img.shape[:2]
             aspect_ratio = width / height
 
             if aspect_ratio > (max_width / max_height):
@@ -426,11 +415,17 @@ class AnalyzeService(QObject):
                 thumb_height = max_height
                 thumb_width = int(max_height * aspect_ratio)
 
-            # Resize using cv2 - use INTER_AREA for downscaling (faster and better quality)
-            thumb_img = cv2.resize(img_rgb, (thumb_width, thumb_height), interpolation=cv2.INTER_AREA)
+            # Resize the source image directly (cv2.imwrite expects BGR, so no RGB round-trip
+            # is needed) - use INTER_AREA for downscaling (faster and better quality)
+            thumb_img_bgr = cv2.resize(img, (thumb_width, thumb_height), interpolation=cv2.INTER_AREA)
 
-            # Convert RGB back to BGR for cv2.imwrite (cv2 expects BGR format)
-            thumb_img_bgr = cv2.cvtColor(thumb_img, cv2.COLOR_RGB2BGR)
+            # Normalize the (already small) thumbnail to 3-channel BGR
+            if len(thumb_img_bgr.shape) == 2:
+                # Grayscale
+                thumb_img_bgr = cv2.cvtColor(thumb_img_bgr, cv2.COLOR_GRAY2BGR)
+            elif thumb_img_bgr.shape[2] == 4:
+                # BGRA to BGR
+                thumb_img_bgr = cv2.cvtColor(thumb_img_bgr, cv2.COLOR_BGRA2BGR)
 
             # Save as JPEG with balanced quality (80 = good balance of quality and speed)
             # Reduced from 85 for faster writes with minimal visual difference for thumbnails
@@ -1,4 +1,5 @@
 import os
+import shutil
 from ast import literal_eval
 from datetime import datetime
 import uuid
@@ -300,6 +301,13 @@ class XmlService:
         """
         Save the XML document to the specified path.
 
+        The document is written to a temporary file next to the target and then
+        renamed over it, so an interrupted save never leaves a truncated XML file.
+        Symlinks are resolved so the link itself is preserved, and the existing
+        file's permissions are carried over. If the target cannot be replaced
+        (e.g. it is held open by another process on Windows), the file is written
+        in place instead.
+
         Args:
             path (str): The full path where the XML file will be saved.
         """
@@ -308,7 +316,23 @@ class XmlService:
         else:
             mydata = self.xml
 
-        with open(path, "wb") as fh:
+        target_path = os.path.realpath(path)
+        tmp_path = f"{target_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as fh:
+                mydata.write(fh)
+            if os.path.exists(target_path):
+                shutil.copymode(target_path, tmp_path)
+            try:
+                os.replace(tmp_path, target_path)
+                return
+            except PermissionError as e:
+                self.logger.warning(f"Could not replace {target_path} atomically ({e}); writing in place")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        with open(target_path, "wb") as fh:
             mydata.write(fh)
 
     def get_review_metadata(self):
@@ -375,7 +399,42 @@ class XmlService:
 
         return review_id
 
-    def set_image_bearing(self, image_path, bearing_deg, source='calculated', quality='good'):
+    def _resolve_stored_path(self, stored_path):
+        """
+        Resolve an image 'path' attribute to a normalized absolute-or-XML-relative path.
+
+        Args:
+            stored_path (str): The 'path' attribute as stored in the XML.
+
+        Returns:
+            str: Normalized path suitable for comparison.
+        """
+        stored_path = stored_path.replace('/', os.sep)
+        if not os.path.isabs(stored_path) and self.xml_path:
+            xml_dir = os.path.dirname(self.xml_path)
+            stored_path = os.path.join(xml_dir, stored_path)
+        return os.path.normpath(stored_path)
+
+    def _build_image_index(self):
+        """
+        Build a lookup of normalized image paths to their XML elements.
+
+        Returns:
+            dict: Mapping of normalized image path to image XML element.
+        """
+        index = {}
+        images_xml = self.xml.getroot().find('images')
+        if images_xml is None:
+            return index
+
+        for image_xml in images_xml:
+            stored_path = image_xml.get('path')
+            if stored_path:
+                # Keep the first match to mirror the previous linear-scan behaviour
+                index.setdefault(self._resolve_stored_path(stored_path), image_xml)
+        return index
+
+    def set_image_bearing(self, image_path, bearing_deg, source='calculated', quality='good', image_index=None):
         """
         Set bearing metadata for an image in the XML.
 
@@ -384,37 +443,23 @@ class XmlService:
             bearing_deg (float): Bearing in degrees [0, 360).
             source (str): Source of bearing ('kml', 'gpx', 'csv', 'auto_prev_next', etc.).
             quality (str): Quality indicator ('good', 'turn_inferred', 'gap', 'hover_estimate').
+            image_index (dict, optional): Prebuilt index from _build_image_index, reused
+                when updating many images.
 
         Returns:
             bool: True if image was found and updated, False otherwise.
         """
         try:
-            root = self.xml.getroot()
-            images_xml = root.find('images')
-
-            if images_xml is None:
-                return False
-
-            # Normalize path for comparison
-            image_path_norm = os.path.normpath(image_path)
-
-            for image_xml in images_xml:
-                # Get stored path and resolve it
-                stored_path = image_xml.get('path')
-                if stored_path:
-                    stored_path = stored_path.replace('/', os.sep)
-                    if not os.path.isabs(stored_path) and self.xml_path:
-                        xml_dir = os.path.dirname(self.xml_path)
-                        stored_path = os.path.join(xml_dir, stored_path)
-                    stored_path_norm = os.path.normpath(stored_path)
+            if image_index is None:
+                image_index = self._build_image_index()
 
-                    # Check if paths match
-                    if stored_path_norm == image_path_norm:
-                        # Set bearing attributes
-                        image_xml.set('bearing', f"{bearing_deg:.2f}")
-                        image_xml.set('bearing_source', source)
-                        image_xml.set('bearing_quality', quality)
-                        return True
+            image_xml = image_index.get(os.path.normpath(image_path))
+            if image_xml is not None:
+                # Set bearing attributes
+                image_xml.set('bearing', f"{bearing_deg:.2f}")
+                image_xml.set('bearing_source', source)
+                image_xml.set('bearing_quality', quality)
+                return True
 
             self.logger.warning(f"Image not found in XML for bearing update: {image_path}")
             return False
@@ -434,34 +479,14 @@ class XmlService:
             dict or None: Dictionary with 'bearing', 'source', 'quality', or None if not found.
         """
         try:
-            root = self.xml.getroot()
-            images_xml = root.find('images')
-
-            if images_xml is None:
-                return None
-
-            # Normalize path for comparison
-            image_path_norm = os.path.normpath(image_path)
+            image_xml = self._build_image_index().get(os.path.normpath(image_path))
 
-            for image_xml in images_xml:
-                # Get stored path and resolve it
-                stored_path = image_xml.get('path')
-                if stored_path:
-                    stored_path = stored_path.replace('/', os.sep)
-                    if not os.path.isabs(stored_path) and self.xml_path:
-                        xml_dir = os.path.dirname(self.xml_path)
-                        stored_path = os.path.join(xml_dir, stored_path)
-                    stored_path_norm = os.path.normpath(stored_path)
-
-                    # Check if paths match
-                    if stored_path_norm == image_path_norm:
-                        if image_xml.get('bearing'):
-                            return {
-                                'bearing': float(image_xml.get('bearing')),
-                                'source': image_xml.get('bearing_source', 'unknown'),
-                                'quality': image_xml.get('bearing_quality', 'unknown')
-                            }
-                        return None
+            if image_xml is not None and image_xml.get('bearing'):
+                return {
+                    'bearing': float(image_xml.get('bearing')),
+                    'source': image_xml.get('bearing_source', 'unknown'),
+                    'quality': image_xml.get('bearing_quality', 'unknown')
+                }
 
             return None
 
@@ -482,13 +507,15 @@ class XmlService:
         """
         try:
             updated_count = 0
+            image_index = self._build_image_index()
 
             for image_path, result in bearing_results.items():
                 success = self.set_image_bearing(
                     image_path,
                     result.bearing_deg,
                     result.source,
-                    result.quality
+                    result.quality,
+                    image_index=image_index
                 )
                 if success:
                     updated_count += 1
@@ -472,12 +472,13 @@ class ThumbnailCacheService:
         # Count disk cache files
         disk_count = 0
         disk_size = 0
-        if self.cache_dir:
-            disk_count += sum(1 for _ in self.cache_dir.rglob("*.jpg"))
-            disk_size += sum(f.stat().st_size for f in self.cache_dir.rglob("*.jpg"))
-        if self.dataset_cache_dir:
-            disk_count += sum(1 for _ in self.dataset_cache_dir.rglob("*.jpg"))
-            disk_size += sum(f.stat().st_size for f in self.dataset_cache_dir.rglob("*.jpg"))
+        for cache_dir in (self.cache_dir, self.dataset_cache_dir):
+            if not cache_dir:
+                continue
+            # Single streaming walk per directory for both the count and the size
+            for f in cache_dir.rglob("*.jpg"):
+                disk_count += 1
+                disk_size += f.stat().st_size
 
         # Get memory cache stats
         cache_info = self.get_thumbnail_from_memory.cache_info()
@@ -950,7 +950,7 @@ class PdfGeneratorService:
 
             # Check cache first
             if cache_path.exists():
-                tile_img = cv2.imread(str(cache_path))
+                tile_img = cv2.imdecode(np.fromfile(str(cache_path), dtype=np.uint8), cv2.IMREAD_COLOR)
                 if tile_img is not None and tile_img.shape[0] == 256 and tile_img.shape[1] == 256:
                     return tile_img
 
@@ -1,6 +1,6 @@
 import math
 import numpy as np
-import colorsys
+from functools import lru_cache
 from pathlib import Path
 from helpers.MetaDataHelper import MetaDataHelper
 from helpers.LocationInfo import LocationInfo
@@ -26,6 +26,101 @@ class AOIService:
             img_array=img_array
         )
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _circle_mask(radius):
+        """
+        Boolean disk mask of shape (2 * radius + 1, 2 * radius + 1), cached per radius.
+
+        The returned array is read-only because it is shared between callers.
+        """
+        y, x = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+        mask = (x * x + y * y) <= radius * radius
+        mask.setflags(write=False)
+        return mask
+
+    @staticmethod
+    def sample_circle(array, center, radius):
+        """
+        Gather the values of an image-like array that fall inside a circle.
+
+        Args:
+            array (np.ndarray): 2D (H, W) or 3D (H, W, C) array to sample.
+            center (tuple): (x, y) circle center in pixel coordinates.
+            radius (int): Circle radius in pixels.
+
+        Returns:
+            np.ndarray: (N,) or (N, C) array of values inside the circle, clipped to the array bounds.
+        """
+        cx, cy = int(center[0]), int(center[1])
+        radius = max(int(radius), 0)
+        height, width = array.shape[:2]
+
+        x0, x1 = max(0, cx - radius), min(width, cx + radius + 1)
+        y0, y1 = max(0, cy - radius), min(height, cy + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return array[:0, :0].reshape((0,) + array.shape[2:])
+
+        # Slice the canonical mask to match the bbox clipped at the image edges
+        mask = AOIService._circle_mask(radius)[
+            y0 - (cy - radius):y1 - (cy - radius),
+            x0 - (cx - radius):x1 - (cx - radius)
+        ]
+        return array[y0:y1, x0:x1][mask]
+
+    @staticmethod
+    def circle_mean(array, center, radius):
+        """
+        Mean of an image-like array over the pixels inside a circle.
+
+        Args:
+            array (np.ndarray): 2D (H, W) or 3D (H, W, C) array to sample.
+            center (tuple): (x, y) circle center in pixel coordinates.
+            radius (int): Circle radius in pixels.
+
+        Returns:
+            float, np.ndarray or None: Scalar mean for 2D input, per-channel means for 3D input,
+                                       or None if no pixel of the circle lies inside the array.
+        """
+        values = AOIService.sample_circle(array, center, radius)
+        if len(values) == 0:
+            return None
+        return values.mean(axis=0)
+
+    @staticmethod
+    def points_mean(array, points):
+        """
+        Mean of an image-like array at a set of (x, y) pixel coordinates.
+
+        Points outside the array bounds are ignored.
+
+        Args:
+            array (np.ndarray): 2D (H, W) or 3D (H, W, C) array to sample.
+            points: Sequence of (x, y) pairs or an (N, 2) integer array.
+
+        Returns:
+            float, np.ndarray or None: Scalar mean for 2D input, per-channel means for 3D input,
+                                       or None if no point lies inside the array.
+        """
+        points = AOIService._as_point_array(points)
+        height, width = array.shape[:2]
+        xs, ys = points[:, 0], points[:, 1]
+        valid = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        if not valid.any():
+            return None
+        return array[ys[valid], xs[valid]].mean(axis=0)
+
+    @staticmethod
+    def _as_point_array(points):
+        """Convert detected pixels to an (N, 2) int64 array of (x, y), dropping malformed entries."""
+        if isinstance(points, np.ndarray) and points.ndim == 2 and points.shape[1] >= 2:
+            return np.ascontiguousarray(points[:, :2], dtype=np.int64)
+        pairs = [
+            (int(p[0]), int(p[1])) for p in points
+            if isinstance(p, (list, tuple, np.ndarray)) and len(p) >= 2
+        ]
+        return np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
     def estimate_aoi_gps(self, image, aoi, agl_override_m=None):
         """
         Estimates the GPS coordinates of an AOI using a pinhole projection on a flat ground plane.
@@ -187,6 +282,95 @@ class AOIService:
             'center_pixels': aoi['center']
         }
 
+    @staticmethod
+    def _hue_and_marker_rgb(r, g, b):
+        """
+        Compute the hue of an 8-bit RGB color and its full-saturation, full-value counterpart.
+
+        Uses exact integer arithmetic: the hue position is kept as the numerator ``n`` over
+        the chroma ``d`` (hue = 60 * n / d degrees), so the marker channels are interpolated
+        from the exact remainder rather than a rounded degree. The result matches
+        colorsys.rgb_to_hsv followed by colorsys.hsv_to_rgb(h, 1.0, 1.0) and int() truncation,
+        except that values colorsys computes a hair below a whole number in floating point
+        (and truncates one lower) come out exact here.
+
+        Args:
+            r (int): Red channel (0-255)
+            g (int): Green channel (0-255)
+            b (int): Blue channel (0-255)
+
+        Returns:
+            tuple: (hue_degrees, (r, g, b)) with hue in [0, 360) and marker channels in 0-255
+        """
+        mx = max(r, g, b)
+        d = mx - min(r, g, b)
+        if d == 0:
+            return 0, (255, 0, 0)
+
+        # Hue position in sixths of the color wheel, as the fraction n / d in [0, 6)
+        if mx == r:
+            n = (g - b) % (6 * d)
+        elif mx == g:
+            n = b - r + 2 * d
+        else:
+            n = r - g + 4 * d
+        hue = 60 * n // d
+
+        sextant, rem = divmod(n, d)
+        rising = 255 * rem // d
+        falling = 255 * (d - rem) // d
+        marker_rgb = (
+            (255, rising, 0),
+            (falling, 255, 0),
+            (0, 255, rising),
+            (0, falling, 255),
+            (rising, 0, 255),
+            (255, 0, falling),
+        )[sextant]
+        return hue, marker_rgb
+
+    @staticmethod
+    def compute_representative_color(img_array, aoi):
+        """
+        Calculate a representative color for an AOI from an already loaded RGB array.
+
+        Same result as get_aoi_representative_color, without needing an AOIService instance.
+
+        Args:
+            img_array (np.ndarray): RGB image array
+            aoi (dict): AOI with 'center', 'radius', and optionally 'detected_pixels'
+
+        Returns:
+            dict or None: See get_aoi_representative_color
+        """
+        center = aoi.get('center', [0, 0])
+        radius = aoi.get('radius', 0)
+
+        # Average the detected pixels if we have them, otherwise the whole circle
+        detected_pixels = aoi.get('detected_pixels')
+        if detected_pixels is not None and len(detected_pixels) > 0:
+            avg_rgb = AOIService.points_mean(img_array, detected_pixels)
+        else:
+            avg_rgb = AOIService.circle_mean(img_array, center, radius)
+
+        if avg_rgb is None:
+            return None
+
+        r, g, b = int(avg_rgb[0]), int(avg_rgb[1]), int(avg_rgb[2])
+
+        # Hue plus a full saturation and full value version for a vibrant marker
+        hue_degrees, marker_rgb = AOIService._hue_and_marker_rgb(r, g, b)
+
+        # Format color info
+        hex_color = f"#{marker_rgb[0]:02x}{marker_rgb[1]:02x}{marker_rgb[2]:02x}"
+
+        return {
+            'rgb': marker_rgb,
+            'hex': hex_color,
+            'hue_degrees': hue_degrees,
+            'avg_rgb': (r, g, b)
+        }
+
     def get_aoi_representative_color(self, aoi):
         """
         Calculate a representative color for an AOI.
@@ -206,54 +390,7 @@ class AOIService:
             } or None if calculation fails
         """
         try:
-            img_array = self.image_service.img_array
-            height, width = img_array.shape[:2]
-
-            center = aoi.get('center', [0, 0])
-            radius = aoi.get('radius', 0)
-            cx, cy = center
-
-            # Collect RGB values within the AOI
-            colors = []
-
-            # If we have detected pixels, use those
-            if 'detected_pixels' in aoi and aoi['detected_pixels']:
-                for pixel in aoi['detected_pixels']:
-                    if isinstance(pixel, (list, tuple)) and len(pixel) >= 2:
-                        px, py = int(pixel[0]), int(pixel[1])
-                        if 0 <= py < height and 0 <= px < width:
-                            colors.append(img_array[py, px])
-            # Otherwise sample within the circle
-            else:
-                for y in range(max(0, cy - radius), min(height, cy + radius + 1)):
-                    for x in range(max(0, cx - radius), min(width, cx + radius + 1)):
-                        if (x - cx) ** 2 + (y - cy) ** 2 <= radius ** 2:
-                            colors.append(img_array[y, x])
-
-            if not colors:
-                return None
-
-            # Calculate average RGB
-            avg_rgb = np.mean(colors, axis=0).astype(int)
-            r, g, b = int(avg_rgb[0]), int(avg_rgb[1]), int(avg_rgb[2])
-
-            # Convert to HSV
-            h, _, _ = colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
-
-            # Create full saturation and full value version for vibrant marker
-            full_sat_rgb = colorsys.hsv_to_rgb(h, 1.0, 1.0)
-            marker_rgb = tuple(int(c * 255) for c in full_sat_rgb)
-
-            # Format color info
-            hex_color = '#{:02x}{:02x}{:02x}'.format(*marker_rgb)
-            hue_degrees = int(h * 360)
-
-            return {
-                'rgb': marker_rgb,
-                'hex': hex_color,
-                'hue_degrees': hue_degrees,
-                'avg_rgb': (r, g, b)
-            }
+            return self.compute_representative_color(self.image_service.img_array, aoi)
 
         except Exception as e:
             if self.logger:
@@ -6,10 +6,14 @@ detection results, including mask-based highlighting and pixel-based highlightin
 """
 
 import os
+from functools import lru_cache
+
 import cv2
 import numpy as np
 import tifffile
 
+from core.services.image.AOIService import AOIService
+
 
 class ImageHighlightService:
     """
@@ -33,20 +37,14 @@ class ImageHighlightService:
         Returns:
             np.ndarray: The image array with mask applied.
         """
-        if not mask_path or not os.path.exists(mask_path):
+        if not mask_path:
+            return image_array
+        try:
+            stat = os.stat(mask_path)
+        except OSError:
             return image_array
 
-        # Load the mask depending on format
-        if mask_path.lower().endswith((".tif", ".tiff")):
-            # Read multi-band GeoTIFF and pull first band as mask
-            data = tifffile.imread(mask_path)
-            if data.ndim == 3:  # (bands, height, width)
-                mask = data[0].astype(np.uint8)
-            else:
-                mask = data.astype(np.uint8)
-        else:
-            # Fallback: load grayscale PNG
-            mask = cv2.imread(mask_path, cv2.IMREAD_GRAYSCALE)
+        mask = ImageHighlightService._load_mask(mask_path, stat.st_mtime_ns, stat.st_size)
 
         if mask is None:
             return image_array
@@ -72,6 +70,43 @@ class ImageHighlightService:
 
         return highlighted_image
 
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _load_mask(mask_path, mtime_ns, size):
+        """
+        Decodes the detection band of a mask file, cached per path, modification time and size.
+
+        The viewer re-applies the highlight every time an image is reloaded (toggling
+        overlays, adjusting the image), so caching avoids decoding the same mask again.
+
+        Args:
+            mask_path (str): Path to the mask file (.tif or .png).
+            mtime_ns (int): Modification time of the file in nanoseconds.
+            size (int): Size of the file in bytes. Together with mtime_ns this invalidates
+                entries for masks rewritten within the filesystem's timestamp resolution.
+
+        Returns:
+            np.ndarray or None: Read-only uint8 mask, or None if it could not be decoded.
+        """
+        # Load the mask depending on format
+        if mask_path.lower().endswith((".tif", ".tiff")):
+            # Read multi-band GeoTIFF and pull first band as mask. Bands are normally
+            # stored one per page, so this avoids decoding the thermal bands.
+            with tifffile.TiffFile(mask_path) as tif:
+                data = tif.pages[0].asarray()
+            if data.ndim == 3:  # (bands, height, width)
+                mask = data[0].astype(np.uint8)
+            else:
+                mask = data.astype(np.uint8)
+        else:
+            # Fallback: load grayscale PNG (imdecode from a buffer also handles non-ASCII paths)
+            mask = cv2.imdecode(np.fromfile(mask_path, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+
+        if mask is not None:
+            # Shared between callers through the cache
+            mask.setflags(write=False)
+        return mask
+
     @staticmethod
     def highlight_aoi_pixels(image_array, areas_of_interest, highlight_color=(255, 0, 255)):
         """
@@ -87,18 +122,39 @@ class ImageHighlightService:
         """
         highlighted_image = image_array.copy()
 
+        # Only 3-channel images are highlighted
+        if len(highlighted_image.shape) != 3 or highlighted_image.shape[2] != 3:
+            return highlighted_image
+
         # Convert highlight color to numpy array
         highlight_color_array = np.array(highlight_color, dtype=np.uint8)
 
+        # Gather every AOI's (x, y) pairs into one preallocated array so the
+        # highlight is applied with a single vectorized assignment
+        pixel_arrays = []
         for aoi in areas_of_interest or []:
-            if "detected_pixels" in aoi and aoi["detected_pixels"]:
-                for pixel in aoi["detected_pixels"]:
-                    if isinstance(pixel, (list, tuple)) and len(pixel) >= 2:
-                        x, y = int(pixel[0]), int(pixel[1])
-                        # Check bounds
-                        if 0 <= y < highlighted_image.shape[0] and 0 <= x < highlighted_image.shape[1]:
-                            # Convert from BGR to RGB for display if needed
-                            if len(highlighted_image.shape) == 3 and highlighted_image.shape[2] == 3:
-                                highlighted_image[y, x] = highlight_color_array
+            detected_pixels = aoi.get("detected_pixels")
+            if detected_pixels is None or len(detected_pixels) == 0:
+                continue
+            # Malformed entries are dropped individually rather than skipping the AOI
+            pixels = AOIService._as_point_array(detected_pixels)
+            if len(pixels):
+                pixel_arrays.append(pixels)
+
+        total = sum(len(pixels) for pixels in pixel_arrays)
+        if total == 0:
+            return highlighted_image
+
+        coords = np.empty((total, 2), dtype=np.int64)
+        offset = 0
+        for pixels in pixel_arrays:
+            coords[offset:offset + len(pixels)] = pixels
+            offset += len(pixels)
+
+        # Check bounds
+        height, width = highlighted_image.shape[:2]
+        x, y = coords[:, 0], coords[:, 1]
+        in_bounds = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        highlighted_image[y[in_bounds], x[in_bounds]] = highlight_color_array
 
         return highlighted_image
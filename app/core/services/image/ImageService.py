@@ -12,6 +12,7 @@ import tifffile
 from PIL import Image
 
 from core.services.GSDService import GSDService
+from core.services.LoggerService import LoggerService
 
 from helpers.MetaDataHelper import MetaDataHelper
 from helpers.PickleHelper import PickleHelper
@@ -33,6 +34,7 @@ class ImageService:
             calculated_bearing (float, optional): Calculated bearing in degrees [0, 360).
                                                  Used as fallback if EXIF bearing is missing.
         """
+        self.logger = LoggerService()
         self.exif_data = MetaDataHelper.get_exif_data_piexif(path)
         self.xmp_data = MetaDataHelper.get_xmp_data_merged(path)
         self.drone_make = MetaDataHelper.get_drone_make(self.exif_data)
@@ -47,7 +49,8 @@ class ImageService:
             img = cv2.imdecode(np.fromfile(self.path, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
             if img is None:
                 raise ValueError(f"Could not load image: {self.path}")
-            self.img_array = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            # Swap channels in place; the decoded BGR buffer is not needed afterwards
+            self.img_array = cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=img)
 
     def get_relative_altitude(self, distance_unit='m'):
         """
@@ -348,22 +351,19 @@ class ImageService:
             return None
 
         try:
-            # Read all bands from the TIFF
-            data = tifffile.imread(self.mask_path)
+            with tifffile.TiffFile(self.mask_path) as tif:
+                if len(tif.pages) > 1:
+                    # Bands are stored one per page, so only decode the first thermal band (band 1)
+                    thermal_data = tif.pages[1].asarray().astype(np.float32)  # Shape: (height, width)
+                else:
+                    data = tif.asarray()
 
-            # Ensure 3D shape (bands, height, width)
-            if data.ndim == 2:
-                # Only one band, no thermal data
-                return None
-            elif data.ndim == 3:
-                # (bands, height, width)
-                if data.shape[0] < 2:
-                    return None  # no thermal bands present
-                # Take only the first thermal band (band 1) for backward compatibility
-                # Most thermal algorithms only store one temperature band anyway
-                thermal_data = data[1].astype(np.float32)  # Shape: (height, width)
-            else:
-                return None
+                    # Ensure 3D shape (bands, height, width)
+                    if data.ndim != 3 or data.shape[0] < 2:
+                        return None  # no thermal bands present
+                    # Take only the first thermal band (band 1) for backward compatibility
+                    # Most thermal algorithms only store one temperature band anyway
+                    thermal_data = data[1].astype(np.float32)  # Shape: (height, width)
 
             # Convert units if needed
             if unit.upper() == 'F':
@@ -372,7 +372,7 @@ class ImageService:
             return thermal_data
 
         except Exception as e:
-            print(f"Warning: Failed to read thermal data from {self.mask_path}: {e}")
+            self.logger.warning(f"Failed to read thermal data from {self.mask_path}: {e}")
             return None
 
     def _is_autel(self):
@@ -331,3 +331,22 @@ def test_caltopo_export_via_api_credentials_cancelled(mock_cred_dialog, app, moc
         )
 
         assert result is False
+
+
+def test_zip_stage_file_collision_keeps_sources_intact(tmp_path):
+    """Test that staging two sources onto one destination never modifies either source."""
+    src_a = tmp_path / "a" / "img.jpg"
+    src_b = tmp_path / "b" / "img.jpg"
+    src_a.parent.mkdir()
+    src_b.parent.mkdir()
+    src_a.write_bytes(b"image A")
+    src_b.write_bytes(b"image B")
+    dst = tmp_path / "staging" / "img.jpg"
+    dst.parent.mkdir()
+
+    ZipExportController._stage_file(str(src_a), str(dst))
+    ZipExportController._stage_file(str(src_b), str(dst))
+
+    assert src_a.read_bytes() == b"image A"
+    assert src_b.read_bytes() == b"image B"
+    assert dst.read_bytes() == b"image B"
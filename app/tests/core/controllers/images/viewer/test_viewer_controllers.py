@@ -64,6 +64,22 @@ def test_aoi_controller_initialization(app, mock_viewer):
     assert controller.ui_component is not None
 
 
+def test_aoi_flag_saves_are_debounced(app, mock_viewer):
+    """Test that repeated flag toggles coalesce into a single XML write."""
+    controller = AOIController(mock_viewer)
+    aoi = mock_viewer.images[0]['areas_of_interest'][0]
+    aoi['xml'] = MagicMock()
+
+    controller.save_flagged_aoi_to_xml(0, 0, True)
+    controller.save_flagged_aoi_to_xml(0, 0, False)
+    mock_viewer.xml_service.save_xml_file.assert_not_called()
+    assert aoi['flagged'] is False
+
+    controller.flush_xml()
+    controller.flush_xml()
+    mock_viewer.xml_service.save_xml_file.assert_called_once_with(mock_viewer.xml_path)
+
+
 def test_gallery_controller_initialization(app, mock_viewer):
     """Test GalleryController initialization."""
     try:
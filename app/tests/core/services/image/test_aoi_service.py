@@ -128,3 +128,59 @@ def test_calculate_gps_with_custom_altitude(sample_image_data, sample_aoi):
         )
 
         assert result is None or (isinstance(result, tuple) and len(result) == 2)
+
+
+def test_sample_circle_matches_disk():
+    """Test that sample_circle returns exactly the pixels inside the circle."""
+    arr = np.arange(50 * 60).reshape(50, 60)
+    values = AOIService.sample_circle(arr, (30, 25), 5)
+
+    ys, xs = np.mgrid[0:50, 0:60]
+    expected = arr[(xs - 30) ** 2 + (ys - 25) ** 2 <= 25]
+    assert np.array_equal(np.sort(values), np.sort(expected))
+
+
+def test_sample_circle_clipped_at_edges():
+    """Test sampling a circle that extends past the image bounds."""
+    arr = np.ones((20, 20, 3), dtype=np.uint8)
+    values = AOIService.sample_circle(arr, (0, 0), 3)
+
+    # Only the bottom-right quadrant of the disk lies inside the image
+    assert values.shape == (11, 3)
+    assert AOIService.sample_circle(arr, (-10, -10), 3).shape == (0, 3)
+
+
+def test_hue_and_marker_rgb_matches_colorsys():
+    """Test integer hue and marker color against colorsys over an RGB grid."""
+    import colorsys
+
+    for r in range(0, 256, 7):
+        for g in range(0, 256, 7):
+            for b in range(0, 256, 7):
+                h, _, _ = colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
+                expected_rgb = tuple(int(c * 255) for c in colorsys.hsv_to_rgb(h, 1.0, 1.0))
+                expected_hue = int(h * 360)
+
+                hue, marker_rgb = AOIService._hue_and_marker_rgb(r, g, b)
+
+                # colorsys may truncate a float a hair below a whole number one lower
+                hue_diff = abs(hue - expected_hue)
+                assert min(hue_diff, 360 - hue_diff) <= 1, (r, g, b)
+                assert all(abs(a - e) <= 1 for a, e in zip(marker_rgb, expected_rgb)), (r, g, b)
+
+    assert AOIService._hue_and_marker_rgb(200, 10, 100) == (331, (255, 0, 120))
+    assert AOIService._hue_and_marker_rgb(128, 128, 128) == (0, (255, 0, 0))
+
+
+def test_circle_mean_and_points_mean():
+    """Test circle and point means on color and single-channel arrays."""
+    img = np.zeros((40, 40, 3), dtype=np.uint8)
+    img[:, :] = [10, 20, 30]
+    assert np.allclose(AOIService.circle_mean(img, (20, 20), 4), [10, 20, 30])
+    assert AOIService.circle_mean(img, (-50, -50), 4) is None
+
+    temps = np.arange(40 * 40, dtype=np.float32).reshape(40, 40)
+    # Out-of-bounds and malformed points are ignored
+    mean = AOIService.points_mean(temps, [(1, 2), (3, 4), (100, 100), (5,)])
+    assert mean == pytest.approx((temps[2, 1] + temps[4, 3]) / 2)
+    assert AOIService.points_mean(temps, [(100, 100)]) is None
@@ -47,3 +47,75 @@ def test_highlight_aois(image_highlight_service, test_image):
 
     assert highlighted.shape == test_image.shape
     assert highlighted.dtype == test_image.dtype
+
+
+def test_apply_mask_highlight_reuses_decoded_mask(test_image, tmp_path):
+    """Test that re-applying a highlight does not decode the same mask twice."""
+    import cv2
+
+    mask = np.zeros(test_image.shape[:2], dtype=np.uint8)
+    mask[60:80, 60:80] = 255
+    mask_path = str(tmp_path / "mask.png")
+    cv2.imwrite(mask_path, mask)
+
+    ImageHighlightService._load_mask.cache_clear()
+    with patch("core.services.image.ImageHighlightService.cv2.imdecode", wraps=cv2.imdecode) as mock_decode:
+        first = ImageHighlightService.apply_mask_highlight(test_image, mask_path, (255, 0, 0))
+        second = ImageHighlightService.apply_mask_highlight(test_image, mask_path, (255, 0, 0))
+
+    assert mock_decode.call_count == 1
+    assert np.array_equal(first, second)
+    assert not np.array_equal(first[60:80, 60:80], test_image[60:80, 60:80])
+
+
+def test_apply_mask_highlight_reloads_mask_rewritten_with_same_mtime(test_image, tmp_path):
+    """Test that a mask rewritten within the same timestamp is not served from cache."""
+    import cv2
+    import os
+
+    mask = np.zeros(test_image.shape[:2], dtype=np.uint8)
+    mask[60:80, 60:80] = 255
+    mask_path = str(tmp_path / "mask.png")
+    cv2.imwrite(mask_path, mask)
+    original_mtime_ns = os.stat(mask_path).st_mtime_ns
+
+    ImageHighlightService._load_mask.cache_clear()
+    first = ImageHighlightService.apply_mask_highlight(test_image, mask_path, (255, 0, 0))
+
+    mask[:] = 0
+    mask[10:20, 10:20] = 255
+    mask[100:150, 30:90] = 255
+    cv2.imwrite(mask_path, mask)
+    os.utime(mask_path, ns=(original_mtime_ns, original_mtime_ns))
+
+    second = ImageHighlightService.apply_mask_highlight(test_image, mask_path, (255, 0, 0))
+
+    assert not np.array_equal(first, second)
+    assert not np.array_equal(second[10:20, 10:20], test_image[10:20, 10:20])
+
+
+def test_highlight_aoi_pixels_colors_detected_pixels(test_image):
+    """Test that detected pixels are colored and out-of-bounds pixels are ignored."""
+    aois = [
+        {'center': (10, 10), 'radius': 5, 'detected_pixels': [[5, 6], [7, 8]]},
+        {'center': (190, 190), 'radius': 5, 'detected_pixels': [(199, 0), (250, 250), (-1, 3)]},
+        {'center': (100, 100), 'radius': 5, 'detected_pixels': []},
+    ]
+
+    highlighted = ImageHighlightService.highlight_aoi_pixels(test_image, aois, highlight_color=(1, 2, 3))
+
+    assert list(highlighted[6, 5]) == [1, 2, 3]
+    assert list(highlighted[8, 7]) == [1, 2, 3]
+    assert list(highlighted[0, 199]) == [1, 2, 3]
+    assert np.count_nonzero(np.any(highlighted != test_image, axis=2)) == 3
+
+
+def test_highlight_aoi_pixels_skips_only_malformed_entries(test_image):
+    """Test that a ragged detected_pixels list still highlights its valid pixels."""
+    aois = [{'center': (10, 10), 'radius': 5, 'detected_pixels': [[5, 6], [7], [8, 9], None]}]
+
+    highlighted = ImageHighlightService.highlight_aoi_pixels(test_image, aois, highlight_color=(1, 2, 3))
+
+    assert list(highlighted[6, 5]) == [1, 2, 3]
+    assert list(highlighted[9, 8]) == [1, 2, 3]
+    assert np.count_nonzero(np.any(highlighted != test_image, axis=2)) == 2
@@ -96,3 +96,48 @@ def test_save_xml_file(tmp_path):
     path = tmp_path / "output.xml"
     service.save_xml_file(path)
     assert os.path.exists(path)
+    assert not os.path.exists(f"{path}.tmp")
+
+
+def test_set_multiple_bearings(sample_xml):
+    from types import SimpleNamespace
+    service = XmlService(str(sample_xml))
+    xml_dir = os.path.dirname(str(sample_xml))
+    results = {
+        os.path.join(xml_dir, "image1.jpg"): SimpleNamespace(bearing_deg=12.5, source='kml', quality='good'),
+        os.path.join(xml_dir, "missing.jpg"): SimpleNamespace(bearing_deg=90.0, source='kml', quality='good'),
+    }
+
+    assert service.set_multiple_bearings(results) == 1
+    bearing = service.get_image_bearing(os.path.join(xml_dir, "image1.jpg"))
+    assert bearing == {'bearing': 12.5, 'source': 'kml', 'quality': 'good'}
+    assert service.get_image_bearing(os.path.join(xml_dir, "image2.jpg")) is None
+
+
+def test_save_xml_file_preserves_mode_and_symlink(tmp_path):
+    target = tmp_path / "real.xml"
+    target.write_text("<data/>")
+    os.chmod(target, 0o640)
+    link = tmp_path / "link.xml"
+    try:
+        os.symlink(target, link)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not supported here")
+
+    XmlService().save_xml_file(str(link))
+
+    assert os.path.islink(link)
+    assert os.stat(target).st_mode & 0o777 == 0o640
+    assert not os.path.exists(f"{target}.tmp")
+
+
+def test_save_xml_file_falls_back_when_replace_is_denied(tmp_path):
+    from unittest.mock import patch
+    path = tmp_path / "output.xml"
+    path.write_text("<old/>")
+
+    with patch("core.services.XmlService.os.replace", side_effect=PermissionError("in use")):
+        XmlService().save_xml_file(str(path))
+
+    assert ET.parse(path).getroot().tag == "data"
+    assert not os.path.exists(f"{path}.tmp")